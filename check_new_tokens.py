@@ -1,6 +1,57 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import argparse
+import asyncio
+import atexit
+import concurrent.futures
 import datetime
+import functools
+import json
 import os
+import re
+import shelve
+import sys
+import threading
+
+# Optional: transparent ETag / Cache-Control caching; falls back to a
+# plain Session when requests-cache is not installed
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
+
+# Optional: Aho-Corasick multi-pattern matcher; falls back to byte
+# containment scans when pyahocorasick is not installed
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Optional: async HTTP for the fan-out fetches; falls back to thread
+# pools when aiohttp is not installed
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+# Optional: faster JSON parsing; falls back to Response.json() when
+# orjson is not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_loads(resp: requests.Response):
+    """
+    Decode a response body as JSON. orjson parses the raw bytes
+    directly, skipping the charset-detection and decode step that
+    Response.json() performs.
+    """
+    if orjson is not None:
+        return orjson.loads(resp.content)
+    return resp.json()
 
 # Repo and path we are watching
 REPO = "cardano-foundation/cardano-token-registry"
@@ -12,6 +63,65 @@ LOOKBACK_HOURS = int(os.getenv("LOOKBACK_HOURS", "24"))
 # GitHub token for higher rate limits (provided automatically in Actions)
 TOKEN = os.getenv("GITHUB_TOKEN")
 
+# Matches mapping files directly under PATH (one C-level call per file
+# instead of a startswith/endswith pair, and rejects nested subdirs)
+_PATH_RE = re.compile(rf"^{re.escape(PATH)}/[^/]+\.json$")
+
+# Brand-related patterns and suspicious marketing / scammy language
+_BRAND_KEYWORDS = ("night", "knight", "midnight", "mnight", "cnight")
+_SUSPICIOUS_KEYWORDS = (
+    "airdrop", "reward", "bonus", "double", "stake", "staking", "yield", "free",
+)
+
+# Category bits for the keyword scan
+_BRAND_HIT = 1
+_SUSPICIOUS_HIT = 2
+
+# Pre-encoded keyword tables for the fallback scan: containment on
+# bytes takes CPython's tightest memmem-style C path, noticeably
+# faster than the str equivalent for short ASCII keywords
+_BRAND_BYTES = tuple(w.encode("ascii") for w in _BRAND_KEYWORDS)
+_SUSPICIOUS_BYTES = tuple(w.encode("ascii") for w in _SUSPICIOUS_KEYWORDS)
+
+# With pyahocorasick available, both keyword tables collapse into one
+# automaton: a single linear pass over the text finds every hit, with
+# no per-pattern rescans
+if ahocorasick is not None:
+    _KEYWORD_AUTOMATON = ahocorasick.Automaton()
+    for _word in _BRAND_KEYWORDS:
+        _KEYWORD_AUTOMATON.add_word(_word, _BRAND_HIT)
+    for _word in _SUSPICIOUS_KEYWORDS:
+        _KEYWORD_AUTOMATON.add_word(_word, _SUSPICIOUS_HIT)
+    _KEYWORD_AUTOMATON.make_automaton()
+else:
+    _KEYWORD_AUTOMATON = None
+
+
+def _scan_keywords(text: str) -> int:
+    """
+    Scan `text` for brand and suspicious keywords in one pass.
+    Returns a bitmask of _BRAND_HIT / _SUSPICIOUS_HIT.
+    """
+    if _KEYWORD_AUTOMATON is not None:
+        hits = 0
+        for _, category in _KEYWORD_AUTOMATON.iter(text.lower()):
+            hits |= category
+            if hits == _BRAND_HIT | _SUSPICIOUS_HIT:
+                break
+        return hits
+    # Keywords are pure ASCII, so non-ASCII text bytes are dropped
+    # before the containment tests. Deliberately more aggressive than
+    # the automaton path: stripping can splice a keyword together
+    # across non-ASCII filler (e.g. a soft hyphen inside "night"),
+    # which for a scam watcher is a feature, not a false positive
+    tb = text.lower().encode("ascii", "ignore")
+    hits = 0
+    if any(b in tb for b in _BRAND_BYTES):
+        hits |= _BRAND_HIT
+    if any(b in tb for b in _SUSPICIOUS_BYTES):
+        hits |= _SUSPICIOUS_HIT
+    return hits
+
 
 def get_headers():
     headers = {"Accept": "application/vnd.github+json"}
@@ -20,9 +130,201 @@ def get_headers():
     return headers
 
 
+def _build_session() -> requests.Session:
+    """
+    Build the shared Session: keep-alive connection pooling so TLS
+    handshakes amortize across requests, plus retries on transient
+    GitHub 5xx responses.
+
+    With requests-cache installed, the session also persists ETags on
+    disk and sends If-None-Match on repeat requests; 304 replies skip
+    the body transfer and do not count against the GitHub rate limit.
+    Raw files are SHA-pinned and therefore immutable, so they never
+    expire from the cache.
+    """
+    if requests_cache is not None:
+        session = requests_cache.CachedSession(
+            ".gh_cache",
+            backend="sqlite",
+            cache_control=True,
+            expire_after=3600,
+            urls_expire_after={
+                "raw.githubusercontent.com/*": requests_cache.NEVER_EXPIRE,
+            },
+        )
+    else:
+        session = requests.Session()
+    session.headers.update(get_headers())
+    adapter = HTTPAdapter(
+        pool_connections=20,
+        pool_maxsize=20,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[502, 503, 504],
+        ),
+    )
+    session.mount("https://", adapter)
+    return session
+
+
+# Shared across the whole run (and across worker threads, which is safe
+# for independent requests)
+SESSION = _build_session()
+
+
+def _open_metadata_cache():
+    """
+    Open the on-disk metadata cache, keyed by raw URL.
+
+    Raw URLs are SHA-pinned so entries never go stale; in cron runs
+    with overlapping lookback windows this makes repeat files free
+    even when the HTTP cache is unavailable. The workflows persist the
+    cache files across runs via actions/cache. Returns None if the
+    shelf cannot be opened (e.g. read-only checkout).
+    """
+    try:
+        cache = shelve.open(os.getenv("METADATA_CACHE", ".metadata_cache"))
+    except Exception:
+        return None
+    atexit.register(cache.close)
+    return cache
+
+
+_METADATA_CACHE = _open_metadata_cache()
+
+# shelve/dbm does not support concurrent access, so every read and
+# write on the shelf is serialized behind this lock
+_METADATA_CACHE_LOCK = threading.Lock()
+
+
+def _metadata_cache_get(raw_url: str):
+    """
+    Read `raw_url` from the persistent cache, or None on miss.
+    Shelf errors degrade to a miss, matching the open-failure
+    handling.
+    """
+    if _METADATA_CACHE is None:
+        return None
+    try:
+        with _METADATA_CACHE_LOCK:
+            return _METADATA_CACHE.get(raw_url)
+    except Exception:
+        return None
+
+
+def _metadata_cache_put(raw_url: str, data: dict) -> None:
+    """
+    Write `data` to the persistent cache, ignoring shelf errors so a
+    broken cache never takes a run down.
+    """
+    if _METADATA_CACHE is None:
+        return
+    try:
+        with _METADATA_CACHE_LOCK:
+            _METADATA_CACHE[raw_url] = data
+    except Exception:
+        pass
+
+
+def _fetch_json_batch_async(urls: list, ok_default=None):
+    """
+    Fetch many JSON documents concurrently on one asyncio event loop.
+
+    With aiohttp installed the fan-out stages need no worker threads:
+    every GET is in flight together, bounded by a 20-socket connector.
+    Per-URL failures become `ok_default` when given; otherwise any
+    failure aborts the batch. Returns a list aligned with `urls`, or
+    None when aiohttp is unavailable or the batch aborted, so callers
+    can fall back to the thread-pool path.
+    """
+    if aiohttp is None or not urls:
+        return None
+
+    headers = get_headers()
+
+    async def fetch_all():
+        connector = aiohttp.TCPConnector(limit=20)
+        timeout = aiohttp.ClientTimeout(total=30)
+        async with aiohttp.ClientSession(
+            connector=connector, headers=headers, timeout=timeout
+        ) as session:
+
+            async def fetch_one(url):
+                async with session.get(url) as resp:
+                    resp.raise_for_status()
+                    body = await resp.read()
+                    if orjson is not None:
+                        return orjson.loads(body)
+                    return json.loads(body)
+
+            return await asyncio.gather(
+                *(fetch_one(u) for u in urls),
+                return_exceptions=ok_default is not None,
+            )
+
+    try:
+        results = asyncio.run(fetch_all())
+    except Exception:
+        return None
+    if ok_default is not None:
+        results = [
+            ok_default if isinstance(r, BaseException) else r
+            for r in results
+        ]
+    return results
+
+
+def _prefetch_metadata(raw_urls: list) -> None:
+    """
+    Warm the metadata caches for every distinct raw URL, so the
+    enrichment loop reads them without further I/O.
+
+    Prefers one aiohttp event loop writing straight into the
+    persistent cache; falls back to a thread pool over
+    fetch_metadata_from_raw.
+    """
+    urls = [u for u in dict.fromkeys(raw_urls) if u]
+    if not urls:
+        return
+
+    if _METADATA_CACHE is not None:
+        urls = [u for u in urls if _metadata_cache_get(u) is None]
+        if not urls:
+            return
+        results = _fetch_json_batch_async(urls, ok_default={})
+        if results is not None:
+            for url, data in zip(urls, results):
+                if isinstance(data, dict) and data:
+                    _metadata_cache_put(url, data)
+            return
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=16) as ex:
+        list(ex.map(fetch_metadata_from_raw, urls))
+
+
+def _metadata_field(metadata: dict, key: str) -> str:
+    """
+    Read a metadata field as text. CIP-26 entries annotate fields as
+    {"value": ..., "signatures": [...], "sequenceNumber": N}; unwrap
+    those, and coerce anything else through str() so one malformed
+    mapping file never aborts the report.
+    """
+    value = metadata.get(key, "")
+    if isinstance(value, dict):
+        value = value.get("value", "")
+    if value is None:
+        return ""
+    return value if isinstance(value, str) else str(value)
+
+
+@functools.lru_cache(maxsize=1024)
 def extract_subject_from_filename(filename: str) -> str:
     """
     Convert mappings/<subject>.json to <subject>
+
+    Memoized so a file appearing in several commits is only parsed
+    once.
     """
     base = filename
     if "/" in base:
@@ -32,22 +334,61 @@ def extract_subject_from_filename(filename: str) -> str:
     return base
 
 
+@functools.lru_cache(maxsize=None)
 def fetch_metadata_from_raw(raw_url: str) -> dict:
     """
     Fetch the JSON metadata for a single mapping file.
     Returns {} on error.
+
+    Memoized per run: raw URLs are commit-SHA-pinned and therefore
+    content-immutable, so when the same file shows up in several
+    commits in one window only one GET happens.
     """
     if not raw_url:
         return {}
+    cached = _metadata_cache_get(raw_url)
+    if cached is not None:
+        return cached
     try:
-        resp = requests.get(raw_url, timeout=10)
+        resp = SESSION.get(raw_url, timeout=10)
         resp.raise_for_status()
-        data = resp.json()
+        data = _json_loads(resp)
         # CIP-26 entries usually have a "name", "ticker", "description", "url"
-        # If nested, adapt here later
-        return data if isinstance(data, dict) else {}
+        # Nested annotated values are unwrapped by _metadata_field
+        if not isinstance(data, dict):
+            return {}
     except Exception:
         return {}
+    # Only persist successful fetches so transient errors can retry
+    _metadata_cache_put(raw_url, data)
+    return data
+
+
+def fetch_commit_details_rest(commits: list) -> list:
+    """
+    Fetch commit details over REST, up to 10 requests at a time.
+
+    The per-commit fetches are independent and purely I/O-bound, so
+    running them on a thread pool collapses N serial round-trips to
+    roughly ceil(N / 10). With requests-cache active the fetches stay
+    on the shared SESSION so its conditional-request cache keeps
+    working — detail URLs recur across overlapping cron windows, and
+    aiohttp would bypass the cache and re-download every body. Only
+    without that cache does the batch run on one aiohttp event loop
+    instead. Returns a list of detail dicts aligned with `commits`.
+    """
+    if requests_cache is None:
+        details = _fetch_json_batch_async([c["url"] for c in commits])
+        if details is not None:
+            return details
+
+    def fetch_one(commit):
+        resp = SESSION.get(commit["url"], timeout=30)
+        resp.raise_for_status()
+        return _json_loads(resp)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=10) as executor:
+        return list(executor.map(fetch_one, commits))
 
 
 def compute_night_score(text: str, is_new: bool) -> int:
@@ -57,32 +398,17 @@ def compute_night_score(text: str, is_new: bool) -> int:
     anywhere in the text (as substring, any case).
     Also bumps score for suspicious marketing terms.
     """
-    if not text:
-        text = ""
-    t = text.lower()
-
     score = 0
 
-    # Brand-related patterns
-    brand_patterns = ["night", "knight", "midnight", "mnight", "cnight"]
-    if any(p in t for p in brand_patterns):
-        score += 40
-
-    # Suspicious marketing / scammy language
-    suspicious_keywords = [
-        "airdrop",
-        "airdrops",
-        "reward",
-        "rewards",
-        "bonus",
-        "double",
-        "stake",
-        "staking",
-        "yield",
-        "free",
-    ]
-    if any(k in t for k in suspicious_keywords):
-        score += 20
+    # Mapping files often have no description/url, so skip the scan
+    # (and the .lower() allocation inside it) entirely for empty text.
+    # The scan itself stops as soon as both categories have hit.
+    if text:
+        hits = _scan_keywords(text)
+        if hits & _BRAND_HIT:
+            score += 40
+        if hits & _SUSPICIOUS_HIT:
+            score += 20
 
     # Slight bump if the token is newly added
     if is_new:
@@ -103,10 +429,40 @@ def classify_night_level(score: int) -> str:
         return "none"
 
 
-def main():
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description=(
+            "Watch the Cardano token registry for new and updated "
+            "mapping files and score them for NIGHT resemblance."
+        )
+    )
+    parser.add_argument(
+        "--lookback-hours",
+        type=int,
+        default=LOOKBACK_HOURS,
+        help="how far back to look (default: LOOKBACK_HOURS env or 24)",
+    )
+    parser.add_argument(
+        "--no-enrich",
+        action="store_true",
+        help="skip metadata fetches and NIGHT scoring",
+    )
+    parser.add_argument(
+        "--show-updated",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="include updated token mappings in the report",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    lookback_hours = args.lookback_hours
+
     # Use timezone aware UTC to avoid deprecation warnings
     now_utc = datetime.datetime.now(datetime.timezone.utc)
-    since_dt = now_utc - datetime.timedelta(hours=LOOKBACK_HOURS)
+    since_dt = now_utc - datetime.timedelta(hours=lookback_hours)
     since = since_dt.isoformat()
 
     url = f"https://api.github.com/repos/{REPO}/commits"
@@ -115,76 +471,94 @@ def main():
         "since": since,
         "per_page": 50,
     }
-    headers = get_headers()
-
-    resp = requests.get(url, headers=headers, params=params)
+    resp = SESSION.get(url, params=params, timeout=30)
     resp.raise_for_status()
-    commits = resp.json()
-
-    # Use dicts keyed by filename to avoid duplicates across commits
-    new_tokens = {}
-    updated_tokens = {}
-
-    for commit in commits:
-        # Get details of each commit
-        commit_detail = requests.get(commit["url"], headers=headers)
-        commit_detail.raise_for_status()
-        detail = commit_detail.json()
-
+    commits = _json_loads(resp)
+
+    # The listing carries no file data, so fetch all commit details
+    # concurrently in one fan-out stage
+    details = fetch_commit_details_rest(commits)
+
+    # Single pass keyed by filename: "added" outranks "modified", and
+    # for equal status the first (newest) commit seen wins — same
+    # outcome as before, but one dict lookup per file instead of
+    # membership tests against both result dicts plus a pop
+    by_file = {}
+    for commit, detail in zip(commits, details):
         for f in detail.get("files", []):
             filename = f.get("filename", "")
             status = f.get("status")
-            raw_url = f.get("raw_url")
 
-            if not (
-                filename.startswith(f"{PATH}/")
-                and filename.endswith(".json")
-            ):
+            if not _PATH_RE.match(filename):
                 continue
 
-            commit_sha = commit["sha"]
-            commit_date = commit["commit"]["author"]["date"]
+            priority = 2 if status == "added" else 1 if status == "modified" else 0
+            if priority == 0:
+                continue
 
-            # New token mappings (file added)
-            if status == "added":
-                if filename not in new_tokens:
-                    new_tokens[filename] = {
-                        "file": filename,
-                        "commit": commit_sha,
-                        "date": commit_date,
-                        "raw_url": raw_url,
-                    }
-                # Ensure it is not treated as "updated" if we already consider it new
-                if filename in updated_tokens:
-                    updated_tokens.pop(filename, None)
-
-            # Updated token mappings (file modified)
-            elif status == "modified":
-                # Only treat as updated if we have not already classified it as new
-                if filename not in new_tokens and filename not in updated_tokens:
-                    updated_tokens[filename] = {
+            existing = by_file.get(filename)
+            if existing is None or priority > existing[0]:
+                by_file[filename] = (
+                    priority,
+                    {
                         "file": filename,
-                        "commit": commit_sha,
-                        "date": commit_date,
-                        "raw_url": raw_url,
-                    }
+                        "commit": commit["sha"],
+                        "date": commit["commit"]["author"]["date"],
+                        "raw_url": f.get("raw_url"),
+                    },
+                )
+
+    new_tokens = {f: rec for f, (p, rec) in by_file.items() if p == 2}
+    updated_tokens = {f: rec for f, (p, rec) in by_file.items() if p == 1}
+
+    # With --no-show-updated, drop updated tokens before enrichment so
+    # the counts, alert marker and report all stay consistent
+    if not args.show_updated:
+        updated_tokens = {}
 
     # Enrich with subject, metadata and NIGHT scoring
     def enrich_token_info(token_dict: dict, is_new: bool):
+        # The subject comes from the filename alone; once it scores
+        # into the top band the metadata fields can no longer change
+        # the level (scores only ever go up), so skip the raw fetch.
+        # A bare brand hit on an updated token stays at 40 and still
+        # fetches, since a suspicious keyword in the metadata would
+        # lift it to high
+        pending = []
         for info in token_dict.values():
+            subject = extract_subject_from_filename(info["file"])
+            subject_score = compute_night_score(subject, is_new=is_new)
+            if subject_score >= 50:
+                info["subject"] = subject
+                info["name"] = ""
+                info["ticker"] = ""
+                info["url"] = ""
+                info["night_score"] = subject_score
+                info["night_level"] = classify_night_level(subject_score)
+            else:
+                pending.append(info)
+
+        # Warm the metadata caches concurrently for the rest: the
+        # per-token GETs are independent and idempotent, so they all
+        # run in flight together instead of K serial round-trips
+        _prefetch_metadata([info.get("raw_url") for info in pending])
+
+        for info in pending:
             filename = info["file"]
             subject = extract_subject_from_filename(filename)
             metadata = fetch_metadata_from_raw(info.get("raw_url"))
 
-            name = metadata.get("name", "")
-            ticker = metadata.get("ticker", "")
-            description = metadata.get("description", "")
-            url_field = metadata.get("url", "")
+            name = _metadata_field(metadata, "name")
+            ticker = _metadata_field(metadata, "ticker")
+            description = _metadata_field(metadata, "description")
+            url_field = _metadata_field(metadata, "url")
 
+            # _metadata_field guarantees strings, so join straight
+            # from a tuple without re-casting or an intermediate list
             text_to_scan = " ".join(
-                str(x)
-                for x in [subject, name, ticker, description, url_field]
-                if x
+                s
+                for s in (subject, name, ticker, description, url_field)
+                if s
             )
             score = compute_night_score(text_to_scan, is_new=is_new)
             level = classify_night_level(score)
@@ -196,34 +570,38 @@ def main():
             info["night_score"] = score
             info["night_level"] = level
 
-    if new_tokens:
-        enrich_token_info(new_tokens, is_new=True)
-    if updated_tokens:
-        enrich_token_info(updated_tokens, is_new=False)
+    if args.no_enrich:
+        # Still resolve subjects so the report lines stay useful
+        for token_dict in (new_tokens, updated_tokens):
+            for info in token_dict.values():
+                info["subject"] = extract_subject_from_filename(info["file"])
+    else:
+        if new_tokens:
+            enrich_token_info(new_tokens, is_new=True)
+        if updated_tokens:
+            enrich_token_info(updated_tokens, is_new=False)
 
     if not new_tokens and not updated_tokens:
         print(
             "✅ No new or updated token registrations in the last",
-            LOOKBACK_HOURS,
+            lookback_hours,
             "hours.",
         )
         return
 
     total_changes = len(new_tokens) + len(updated_tokens)
 
-    # Header line with the 🚨 marker for the workflow
-    print(
-        f"🚨 New or updated Cardano token registrations detected in the last {LOOKBACK_HOURS} hours"
-    )
-    print(f"Total changed: {total_changes}")
-    print(f"New tokens: {len(new_tokens)}")
-    print(f"Updated tokens: {len(updated_tokens)}")
-    print()
-
-    # New token mappings section
-    print("New token mappings:")
-    if new_tokens:
-        for t in new_tokens.values():
+    # Build the whole report in memory and emit it with one write, so
+    # CI log capture sees a single syscall instead of one per line
+    lines = []
+
+    def emit_token_section(title: str, token_dict: dict):
+        lines.append(title)
+        if not token_dict:
+            lines.append("  None in this window")
+            lines.append("")
+            return
+        for t in token_dict.values():
             subject = t.get("subject", "")
             name = t.get("name", "")
             ticker = t.get("ticker", "")
@@ -231,45 +609,38 @@ def main():
             level = t.get("night_level", "none")
 
             # Single hyphen line per token so existing COUNT logic still works
-            print(f"- {subject} ({t['file']})")
-            print(f"  Commit: https://github.com/{REPO}/commit/{t['commit']}")
-            print(f"  Mapping file: https://github.com/{REPO}/blob/master/{t['file']}")
-            print(f"  Metadata: https://tokens.cardano.org/metadata/{subject}")
+            lines.append(f"- {subject} ({t['file']})")
+            lines.append(f"  Commit: https://github.com/{REPO}/commit/{t['commit']}")
+            lines.append(
+                f"  Mapping file: https://github.com/{REPO}/blob/master/{t['file']}"
+            )
+            lines.append(f"  Metadata: https://tokens.cardano.org/metadata/{subject}")
             if name or ticker:
-                print(f"  Name/Ticker: {name} / {ticker}")
+                lines.append(f"  Name/Ticker: {name} / {ticker}")
             if score > 0:
-                print(f"  NIGHT resemblance: {score}/100 ({level})")
-            print()
-    else:
-        print("  None in this window\n")
+                lines.append(f"  NIGHT resemblance: {score}/100 ({level})")
+            lines.append("")
 
-    # Updated token mappings section
-    print("Updated token mappings:")
-    if updated_tokens:
-        for t in updated_tokens.values():
-            subject = t.get("subject", "")
-            name = t.get("name", "")
-            ticker = t.get("ticker", "")
-            score = t.get("night_score", 0)
-            level = t.get("night_level", "none")
+    # Header line with the 🚨 marker for the workflow
+    lines.append(
+        f"🚨 New or updated Cardano token registrations detected in the last {lookback_hours} hours"
+    )
+    lines.append(f"Total changed: {total_changes}")
+    lines.append(f"New tokens: {len(new_tokens)}")
+    lines.append(f"Updated tokens: {len(updated_tokens)}")
+    lines.append("")
 
-            print(f"- {subject} ({t['file']})")
-            print(f"  Commit: https://github.com/{REPO}/commit/{t['commit']}")
-            print(f"  Mapping file: https://github.com/{REPO}/blob/master/{t['file']}")
-            print(f"  Metadata: https://tokens.cardano.org/metadata/{subject}")
-            if name or ticker:
-                print(f"  Name/Ticker: {name} / {ticker}")
-            if score > 0:
-                print(f"  NIGHT resemblance: {score}/100 ({level})")
-            print()
-    else:
-        print("  None in this window\n")
+    emit_token_section("New token mappings:", new_tokens)
+    if args.show_updated:
+        emit_token_section("Updated token mappings:", updated_tokens)
 
-    print("You can view all mappings here:")
-    print(
+    lines.append("You can view all mappings here:")
+    lines.append(
         "https://github.com/cardano-foundation/cardano-token-registry/tree/master/mappings"
     )
 
+    sys.stdout.write("\n".join(lines) + "\n")
+
 
 if __name__ == "__main__":
     main()